@@ -0,0 +1,114 @@
+import html
+from datetime import datetime, timezone
+
+import streamlit as st
+
+from utils.store import delete_video, find_video, load_store, move_video, search_videos
+
+st.set_page_config(page_title="Video Library", page_icon="🎬", layout="wide")
+
+
+def video_card(cat: str, video: dict) -> None:
+    if video.get("thumbnail_url"):
+        # A raw lazy <img> lets the browser fetch thumbnails straight from
+        # i.ytimg.com as they scroll into view; st.image would proxy every
+        # one through the Streamlit server eagerly.
+        st.markdown(
+            f'<img src="{html.escape(video["thumbnail_url"])}" '
+            'loading="lazy" decoding="async" style="width:100%">',
+            unsafe_allow_html=True,
+        )
+    st.markdown(f"**{video.get('title') or video['id']}**")
+    if video.get("channel"):
+        st.caption(f"{video['channel']} · {cat}")
+    else:
+        st.caption(cat)
+    added = video.get("added_at")
+    if added:
+        if isinstance(added, (int, float)):
+            added = datetime.fromtimestamp(added, tz=timezone.utc).strftime("%Y-%m-%d")
+        else:  # ISO string from an older store
+            added = str(added)[:10]
+        st.caption(f"Added {added}")
+    play, move, delete = st.columns(3)
+    if play.button("Play", key=f"play-{cat}-{video['id']}"):
+        st.session_state["playing"] = (cat, video["id"])
+        st.rerun()
+    # Default the widget to the video's own category so the move only
+    # fires when the user actually picks a different one, not on render.
+    options = list(st.session_state["store"]["categories"])
+    dst = move.selectbox(
+        "Move to",
+        options,
+        index=options.index(cat),
+        key=f"move-{cat}-{video['id']}",
+        label_visibility="collapsed",
+    )
+    if dst != cat and move_video(st.session_state["store"], cat, dst, video["id"]):
+        st.rerun()
+    if delete.button("Delete", key=f"del-{cat}-{video['id']}"):
+        delete_video(st.session_state["store"], cat, video["id"])
+        st.rerun()
+
+
+PAGE_SIZE = 30
+
+
+def show_library(
+    videos: list,
+    empty_message: str = "No videos yet. Add one from the **Add Video** page.",
+) -> None:
+    if not videos:
+        st.info(empty_message)
+        return
+    # Paginate so a large library doesn't push hundreds of cards into one
+    # rerun, and create the three columns once instead of per row.
+    pages = (len(videos) + PAGE_SIZE - 1) // PAGE_SIZE
+    page = 1
+    if pages > 1:
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1)
+    start = (page - 1) * PAGE_SIZE
+    cols = st.columns(3)
+    for i, (cat, video) in enumerate(videos[start : start + PAGE_SIZE]):
+        with cols[i % 3]:
+            video_card(cat, video)
+
+
+def show_player(store: dict) -> None:
+    cat, vid = st.session_state["playing"]
+    video = find_video(store, cat, vid)
+    if video is not None:
+        st.video(video["url"])
+        st.subheader(video.get("title") or vid)
+        if video.get("notes"):
+            st.write(video["notes"])
+    if st.button("Back to library"):
+        del st.session_state["playing"]
+        st.rerun()
+
+
+store = load_store()
+st.session_state["store"] = store
+
+st.title("🎬 Video Library")
+
+query = st.sidebar.text_input("Search")
+category = st.sidebar.selectbox("Category", ["All"] + list(store["categories"]))
+
+if st.session_state.get("playing"):
+    show_player(store)
+elif query:
+    show_library(
+        search_videos(store, query),
+        empty_message="No matches. Searches need at least two characters.",
+    )
+else:
+    if category == "All":
+        videos = [
+            (cat, video)
+            for cat, cat_data in store["categories"].items()
+            for video in cat_data["videos"]
+        ]
+    else:
+        videos = [(category, video) for video in store["categories"][category]["videos"]]
+    show_library(videos)
@@ -0,0 +1,67 @@
+import streamlit as st
+
+from utils.store import add_category, add_video, load_store
+from utils.youtube import fetch_metadata, youtube_id_from_url
+
+st.set_page_config(page_title="Add Video", page_icon="➕")
+
+store = load_store()
+
+st.title("➕ Add Video")
+
+url = st.text_input("YouTube URL")
+
+try:
+    api_key = st.secrets.get("youtube_api_key")
+except Exception:  # no secrets.toml at all — the key is optional
+    api_key = None
+
+if st.button("Fetch metadata"):
+    if not youtube_id_from_url(url):
+        st.error("That does not look like a YouTube URL.")
+    else:
+        try:
+            st.session_state["metadata"] = fetch_metadata(url, api_key)
+        except Exception as exc:
+            st.error(f"Could not fetch metadata: {exc}")
+
+metadata = st.session_state.get("metadata", {})
+
+with st.form("add_video"):
+    title = st.text_input("Title", value=metadata.get("title", ""))
+    channel = st.text_input("Channel", value=metadata.get("channel", ""))
+    tags = st.text_input("Tags (comma-separated)", value=", ".join(metadata.get("tags", [])))
+    notes = st.text_area("Notes")
+    category = st.selectbox("Category", list(store["categories"]))
+    submitted = st.form_submit_button("Save video")
+
+if submitted:
+    vid = youtube_id_from_url(url)
+    if not vid:
+        st.error("That does not look like a YouTube URL.")
+    else:
+        add_video(
+            store,
+            category,
+            {
+                "id": vid,
+                "url": url,
+                "title": title,
+                "channel": channel,
+                "tags": [t.strip() for t in tags.split(",") if t.strip()],
+                "notes": notes,
+                "thumbnail_url": metadata.get(
+                    "thumbnail_url", f"https://i.ytimg.com/vi/{vid}/hqdefault.jpg"
+                ),
+            },
+        )
+        st.session_state.pop("metadata", None)
+        st.success(f"Saved to {category}.")
+
+st.divider()
+new_category = st.text_input("New category")
+if st.button("Add category"):
+    if add_category(store, new_category):
+        st.rerun()
+    else:
+        st.error("Category is empty or already exists.")
@@ -0,0 +1,59 @@
+import json
+
+import orjson
+import streamlit as st
+
+from utils.store import add_video, batch, load_store, save_store, update_video
+from utils.youtube import refresh_all_metadata
+
+st.set_page_config(page_title="Backup", page_icon="💾")
+
+store = load_store()
+
+st.title("💾 Backup & Restore")
+
+# Hand download_button bytes directly: orjson skips the stdlib's slow
+# string build and Streamlit skips re-encoding str to utf-8.
+st.download_button(
+    "Backup JSON",
+    data=orjson.dumps(store, option=orjson.OPT_INDENT_2),
+    file_name="video_library_backup.json",
+    mime="application/json",
+)
+
+uploaded = st.file_uploader("Restore from backup", type="json")
+if uploaded is not None and st.button("Restore"):
+    try:
+        backup = json.load(uploaded)
+    except ValueError:
+        st.error("Not a valid backup file.")
+    else:
+        store = {"categories": {}}
+        with batch(store):
+            save_store(store)
+            for cat, cat_data in backup.get("categories", {}).items():
+                # Create the category up front so empty ones survive the
+                # restore; add_video only creates them as a side effect.
+                store["categories"].setdefault(cat, {"videos": []})
+                for video in cat_data.get("videos", []):
+                    add_video(store, cat, video)
+        st.success("Library restored.")
+        st.rerun()
+
+st.divider()
+if st.button("Refresh all metadata"):
+    urls = [
+        video["url"]
+        for cat_data in store["categories"].values()
+        for video in cat_data["videos"]
+        if video.get("url")
+    ]
+    with st.spinner(f"Refreshing {len(urls)} videos…"):
+        fresh = refresh_all_metadata(urls)
+    with batch(store):
+        for cat, cat_data in store["categories"].items():
+            for video in cat_data["videos"]:
+                changes = fresh.get(video.get("url"))
+                if changes:
+                    update_video(store, cat, video["id"], changes)
+    st.success(f"Refreshed {len(fresh)} of {len(urls)} videos.")
@@ -0,0 +1,302 @@
+"""Persistence, indexing and search helpers for the video library.
+
+The store is a plain dict persisted as ``data_store.msgpack``::
+
+    {
+        "categories": {
+            "<name>": {"videos": [{"id": ..., "title": ..., ...}, ...]},
+            ...
+        }
+    }
+
+Search runs against a module-level inverted index (token -> posting set)
+that is rebuilt on load and patched incrementally by the mutators, so a
+query costs a few set intersections instead of a string scan over every
+field of every video.
+"""
+
+import json
+import os
+import re
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from time import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import msgpack
+import streamlit as st
+
+# msgpack halves the file against indented JSON (13 key names repeated per
+# video dominate the size) and unpacks faster. Legacy JSON stores are
+# migrated on first read.
+DATA_FILE = "data_store.msgpack"
+LEGACY_DATA_FILE = "data_store.json"
+
+_WORD_RE = re.compile(r"\w+")
+_WORDS_ONLY_RE = re.compile(r"[\w\s]+")
+
+# token -> {(category, video_id), ...}
+INDEX: Dict[str, Set[Tuple[str, str]]] = {}
+
+# (category, video_id) -> video dict, used to resolve postings back to videos.
+_BY_ID: Dict[Tuple[str, str], Dict] = {}
+
+# (category, video_id) -> precomputed lowercase haystack, so the substring
+# fallback never rebuilds the joined string per query.
+_HAY: Dict[Tuple[str, str], str] = {}
+
+_SEARCH_FIELDS = ("title", "channel", "notes", "url")
+
+
+def _tokenize(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def _video_tokens(cat: str, video: Dict) -> Set[str]:
+    parts = [video.get(field) or "" for field in _SEARCH_FIELDS]
+    parts.extend(video.get("tags") or [])
+    parts.append(cat)
+    return set(_tokenize(" ".join(parts)))
+
+
+def _video_haystack(cat: str, video: Dict) -> str:
+    return " ".join(
+        [
+            video.get("title") or "",
+            video.get("channel") or "",
+            " ".join(video.get("tags") or []),
+            video.get("notes") or "",
+            video.get("url") or "",
+            cat,
+        ]
+    ).lower()
+
+
+def _index_video(cat: str, video: Dict) -> None:
+    key = (cat, video["id"])
+    _BY_ID[key] = video
+    _HAY[key] = _video_haystack(cat, video)
+    for token in _video_tokens(cat, video):
+        INDEX.setdefault(token, set()).add(key)
+
+
+def _unindex_video(cat: str, video: Dict) -> None:
+    key = (cat, video["id"])
+    _BY_ID.pop(key, None)
+    _HAY.pop(key, None)
+    for token in _video_tokens(cat, video):
+        postings = INDEX.get(token)
+        if postings is not None:
+            postings.discard(key)
+            if not postings:
+                del INDEX[token]
+
+
+def _rebuild_index(store: Dict) -> None:
+    INDEX.clear()
+    _BY_ID.clear()
+    _HAY.clear()
+    for cat, cat_data in store["categories"].items():
+        for video in cat_data["videos"]:
+            _index_video(cat, video)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_store_cached(mtime: float) -> Dict:
+    # *mtime* is only part of the cache key: the parse is reused until the
+    # file actually changes on disk. cache_resource (not cache_data) so
+    # every caller shares one store object instead of getting a fresh
+    # copy, which lets the index below survive across reruns.
+    return msgpack.unpackb(Path(DATA_FILE).read_bytes(), raw=False)
+
+
+# The store object the module-level indexes currently describe; rebuilt
+# only when the cache hands back a different object (file changed).
+_indexed_store: Optional[Dict] = None
+
+
+def _migrate_legacy_store() -> Dict:
+    try:
+        store = json.loads(Path(LEGACY_DATA_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {"categories": {"Unsorted": {"videos": []}}}
+    _write_store(store)
+    return store
+
+
+def load_store() -> Dict:
+    global _indexed_store
+    try:
+        store = _load_store_cached(os.path.getmtime(DATA_FILE))
+    except OSError:
+        store = _migrate_legacy_store()
+    if store is not _indexed_store:
+        _rebuild_index(store)
+        _indexed_store = store
+    return store
+
+
+_in_batch = False
+_dirty = False
+
+
+def _write_store(store: Dict, fsync: bool = False) -> None:
+    # Write to a sibling temp file and rename over the store so a crash
+    # mid-write can never leave a truncated data_store.json behind.
+    tmp = DATA_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(msgpack.packb(store, use_bin_type=True))
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, DATA_FILE)
+    _load_store_cached.clear()
+
+
+def save_store(store: Dict, fsync: bool = False) -> None:
+    global _dirty
+    if _in_batch:
+        _dirty = True
+        return
+    _write_store(store, fsync=fsync)
+
+
+@contextmanager
+def batch(store: Dict):
+    """Defer saves inside the block and write the store once at exit.
+
+    Bulk operations (e.g. restoring a backup) call a mutator per video;
+    without batching each call rewrites the whole file.
+    """
+    global _in_batch, _dirty
+    _in_batch = True
+    _dirty = False
+    try:
+        yield
+    finally:
+        _in_batch = False
+        if _dirty:
+            _write_store(store)
+        _dirty = False
+
+
+def add_category(store: Dict, name: str) -> bool:
+    name = name.strip()
+    if not name or name in store["categories"]:
+        return False
+    store["categories"][name] = {"videos": []}
+    save_store(store)
+    return True
+
+
+def find_video(store: Dict, cat: str, vid: str) -> Optional[Dict]:
+    return _BY_ID.get((cat, vid))
+
+
+def _remove_from_list(vids: List[Dict], vid: str) -> None:
+    # Delete in place instead of rebuilding the list, which reallocates
+    # the whole thing to drop one element.
+    for i, v in enumerate(vids):
+        if v["id"] == vid:
+            del vids[i]
+            return
+
+
+def add_video(store: Dict, cat: str, data: Dict) -> Dict:
+    if cat not in store["categories"]:
+        store["categories"][cat] = {"videos": []}
+    data.setdefault("id", uuid.uuid4().hex)
+    # Epoch seconds: sortable, 8 bytes on disk, and avoids the deprecated
+    # datetime.utcnow(). The UI formats it lazily on render.
+    data.setdefault("added_at", time())
+    store["categories"][cat]["videos"].append(data)
+    _index_video(cat, data)
+    save_store(store)
+    return data
+
+
+def update_video(store: Dict, cat: str, vid: str, changes: Dict) -> Optional[Dict]:
+    video = find_video(store, cat, vid)
+    if video is None:
+        return None
+    _unindex_video(cat, video)
+    video.update(changes)
+    _index_video(cat, video)
+    save_store(store)
+    return video
+
+
+def delete_video(store: Dict, cat: str, vid: str) -> bool:
+    video = find_video(store, cat, vid)
+    if video is None:
+        return False
+    _remove_from_list(store["categories"][cat]["videos"], vid)
+    _unindex_video(cat, video)
+    save_store(store)
+    return True
+
+
+def move_video(store: Dict, src: str, dst: str, vid: str) -> bool:
+    video = find_video(store, src, vid)
+    if video is None or dst not in store["categories"]:
+        return False
+    _remove_from_list(store["categories"][src]["videos"], vid)
+    _unindex_video(src, video)
+    store["categories"][dst]["videos"].append(video)
+    _index_video(dst, video)
+    save_store(store)
+    return True
+
+
+def _matches(cat: str, video: Dict, q: str) -> bool:
+    # Check raw fields one by one, short-circuiting on the first hit,
+    # rather than allocating a joined haystack just to search it once.
+    fields = (
+        video.get("title") or "",
+        video.get("channel") or "",
+        video.get("notes") or "",
+        video.get("url") or "",
+        cat,
+    )
+    return any(q in f.lower() for f in fields) or any(
+        q in t.lower() for t in video.get("tags") or ()
+    )
+
+
+def _scan_videos(store: Dict, q: str) -> List[Tuple[str, Dict]]:
+    """Substring fallback for queries the token index cannot answer."""
+    results = []
+    for cat, cat_data in store["categories"].items():
+        for video in cat_data["videos"]:
+            hay = _HAY.get((cat, video["id"]))
+            hit = q in hay if hay is not None else _matches(cat, video, q)
+            if hit:
+                results.append((cat, video))
+    return results
+
+
+def search_videos(store: Dict, query: str) -> List[Tuple[str, Dict]]:
+    """Return ``(category, video)`` pairs matching every word of *query*.
+
+    Word queries are answered from the inverted index by intersecting
+    posting sets, smallest first.  Queries containing non-word characters
+    fall back to a substring scan.
+    """
+    q = query.strip().lower()
+    # A single character matches almost everything and the UI fires a
+    # search per keystroke, so don't scan until the query is meaningful.
+    if len(q) < 2:
+        return []
+    tokens = _tokenize(q)
+    if not tokens:
+        return []
+    if not _WORDS_ONLY_RE.fullmatch(q):
+        return _scan_videos(store, q)
+    postings = sorted((INDEX.get(token, set()) for token in tokens), key=len)
+    hits = set(postings[0])
+    for p in postings[1:]:
+        hits &= p
+        if not hits:
+            break
+    return [(cat, _BY_ID[(cat, vid)]) for cat, vid in sorted(hits)]
@@ -0,0 +1,178 @@
+"""YouTube URL parsing and metadata fetching."""
+
+import asyncio
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+import aiohttp
+import requests
+import streamlit as st
+from diskcache import Cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+OEMBED_URL = "https://www.youtube.com/oembed"
+API_URL = "https://www.googleapis.com/youtube/v3/videos"
+
+REQUEST_TIMEOUT = 10
+
+# On-disk cache for metadata responses: re-adding a URL or restoring a
+# backup should not burn API quota or network round trips.
+_CACHE = Cache(".ytcache")
+CACHE_TTL = 86400
+
+# Shared session: keep-alive avoids a fresh TCP+TLS handshake per call,
+# and the retry policy rides out transient 429/5xx responses from YouTube.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+
+# Covers the four canonical URL shapes (youtu.be, watch, shorts, embed)
+# in a single pass; video ids are always 11 characters. The watch branch
+# allows parameters before v= (e.g. watch?app=desktop&v=..., watch?t=30&v=...).
+_YT_RE = re.compile(
+    r"(?:youtu\.be/|youtube\.com/(?:watch\?(?:[^#\s]*&)?v=|shorts/|embed/))"
+    r"([A-Za-z0-9_-]{11})"
+)
+
+
+@lru_cache(maxsize=4096)
+def youtube_id_from_url(url: str) -> Optional[str]:
+    """Extract the 11-character video id from any common YouTube URL shape."""
+    m = _YT_RE.search(url)
+    return m.group(1) if m else None
+
+
+@_CACHE.memoize(expire=CACHE_TTL)
+def get_oembed(url: str) -> Dict:
+    resp = SESSION.get(
+        OEMBED_URL, params={"url": url, "format": "json"}, timeout=REQUEST_TIMEOUT
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+def get_youtube_api_details(video_id: str, api_key: str) -> Dict:
+    # Serve fresh cache entries directly; for stale ones, revalidate with
+    # If-None-Match so an unchanged video costs a cheap 304 instead of a
+    # full response (and a quota unit).
+    cached = _CACHE.get(("api", video_id))
+    headers = {}
+    if cached is not None:
+        if time.time() - cached["fetched_at"] < CACHE_TTL:
+            return cached["details"]
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+    resp = SESSION.get(
+        API_URL,
+        params={
+            "part": "snippet,contentDetails,statistics",
+            "id": video_id,
+            "key": api_key,
+        },
+        headers=headers,
+        timeout=REQUEST_TIMEOUT,
+    )
+    if resp.status_code == 304 and cached is not None:
+        cached["fetched_at"] = time.time()
+        _CACHE.set(("api", video_id), cached)
+        return cached["details"]
+    resp.raise_for_status()
+    body = resp.json()
+    items = body.get("items") or []
+    if not items:
+        return {}
+    item = items[0]
+    snippet = item.get("snippet", {})
+    details = {
+        "description": snippet.get("description", ""),
+        "tags": snippet.get("tags", []),
+        "duration": item.get("contentDetails", {}).get("duration", ""),
+        "view_count": item.get("statistics", {}).get("viewCount", ""),
+    }
+    _CACHE.set(
+        ("api", video_id),
+        {"etag": body.get("etag"), "details": details, "fetched_at": time.time()},
+    )
+    return details
+
+
+@st.cache_data(ttl=3600, show_spinner="Fetching metadata…")
+def fetch_metadata(url: str, api_key: Optional[str] = None) -> Dict:
+    """Combine oEmbed and (optionally) Data API details for *url*.
+
+    The two requests are independent, so they run concurrently and the
+    call costs max(t_oembed, t_api) instead of their sum.
+    """
+    data: Dict = {"url": url}
+    vid = youtube_id_from_url(url)
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        oembed_future = ex.submit(get_oembed, url)
+        api_future = (
+            ex.submit(get_youtube_api_details, vid, api_key)
+            if api_key and vid
+            else None
+        )
+        oembed = oembed_future.result()
+        data["title"] = oembed.get("title", "")
+        data["channel"] = oembed.get("author_name", "")
+        data["thumbnail_url"] = oembed.get("thumbnail_url", "")
+        if vid:
+            data["id"] = vid
+            data["thumbnail_url"] = f"https://i.ytimg.com/vi/{vid}/hqdefault.jpg"
+        if api_future is not None:
+            data.update(api_future.result())
+    return data
+
+
+async def _refresh_all(urls: List[str]) -> List:
+    async with aiohttp.ClientSession() as session:
+        sem = asyncio.Semaphore(16)
+
+        async def one(url: str):
+            async with sem:
+                async with session.get(
+                    OEMBED_URL,
+                    params={"url": url, "format": "json"},
+                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                ) as resp:
+                    resp.raise_for_status()
+                    return url, await resp.json()
+
+        return await asyncio.gather(*(one(u) for u in urls), return_exceptions=True)
+
+
+def refresh_all_metadata(urls: Iterable[str]) -> Dict[str, Dict]:
+    """Fetch fresh oEmbed metadata for many URLs at once.
+
+    Fans the requests out over a bounded pool of 16 concurrent
+    connections, so refreshing a whole library takes roughly the time of
+    its slowest batch instead of one round trip per video. URLs that fail
+    are simply absent from the result.
+    """
+    results = asyncio.run(_refresh_all(list(urls)))
+    fresh: Dict[str, Dict] = {}
+    for result in results:
+        if isinstance(result, BaseException):
+            continue
+        url, oembed = result
+        fresh[url] = {
+            "title": oembed.get("title", ""),
+            "channel": oembed.get("author_name", ""),
+            "thumbnail_url": oembed.get("thumbnail_url", ""),
+        }
+    return fresh